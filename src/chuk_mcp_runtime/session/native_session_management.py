@@ -218,6 +218,11 @@ class MCPSessionManager:
 class SessionContext:
     """Async context manager for session operations."""
     
+    __slots__ = (
+        "session_manager", "session_id", "user_id", "auto_create",
+        "_session_token", "_user_token",
+    )
+    
     def __init__(
         self, 
         session_manager: MCPSessionManager,
@@ -229,13 +234,14 @@ class SessionContext:
         self.session_id = session_id
         self.user_id = user_id
         self.auto_create = auto_create
-        self.previous_session = None
-        self.previous_user = None
+        self._session_token = None
+        self._user_token = None
     
     async def __aenter__(self) -> str:
-        # Save previous context
-        self.previous_session = self.session_manager.get_current_session()
-        self.previous_user = self.session_manager.get_current_user()
+        # Save previous context - the tokens let __aexit__ reset the
+        # variables to exactly what they were
+        self._session_token = _session_ctx.set(_session_ctx.get())
+        self._user_token = _user_ctx.set(_user_ctx.get())
         
         # Set new context
         if self.session_id:
@@ -253,10 +259,8 @@ class SessionContext:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         # Restore previous context
-        if self.previous_session:
-            self.session_manager.set_current_session(self.previous_session, self.previous_user)
-        else:
-            self.session_manager.clear_context()
+        _session_ctx.reset(self._session_token)
+        _user_ctx.reset(self._user_token)
 
 # ───────────────────────── Tool Integration Helpers ─────────────────────
 
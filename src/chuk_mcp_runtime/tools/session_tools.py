@@ -247,13 +247,13 @@ async def create_session_tool(
     Returns:
         Dictionary containing information about the created session
     """
-    import uuid
+    import secrets
     import time
     
     # Generate session ID if not provided
     if session_id is None:
         timestamp = int(time.time())
-        random_suffix = str(uuid.uuid4().hex)[:8]
+        random_suffix = secrets.token_hex(4)
         session_id = f"session-{timestamp}-{random_suffix}"
     
     try:
@@ -12,8 +12,7 @@ import asyncio
 from chuk_mcp_runtime.common.mcp_tool_decorator import (
     mcp_tool,
     execute_tool,
-    TOOLS_REGISTRY,
-    initialize_tool_registry
+    TOOLS_REGISTRY
 )
 from chuk_mcp_runtime.common.tool_naming import (
     resolve_tool_name,
@@ -170,7 +169,6 @@ def test_nested_prefix_tool():
 
 # --- Tests for tool execution ---
 
-@pytest.mark.asyncio
 async def test_direct_execution():
     """Test direct execution of tool functions."""
     # All tools are async
@@ -183,7 +181,6 @@ async def test_direct_execution():
     assert await multiply_numbers(4, 5) == 20
     assert await subtract_numbers(10, 4) == 6
 
-@pytest.mark.asyncio
 async def test_execute_tool():
     """Test execution of tools by name."""
     # Execute by name
@@ -214,7 +211,6 @@ def test_tool_name_resolution():
     # Nested prefix
     assert resolve_tool_name("prefix.nested.subtract") == "prefix.nested.subtract"
 
-@pytest.mark.asyncio
 async def test_execute_with_resolved_names():
     """Test executing tools with different naming conventions."""
     # Execute with original names first to ensure tools are initialized
@@ -69,7 +69,6 @@ def _stub_toolregistryprovider(monkeypatch):
 
 
 # ── actual test ─────────────────────────────────────────────────────────
-@pytest.mark.asyncio
 async def test_dot_to_underscore_alias_creation():
     # 1) register a dot-notation tool
     @mcp_tool(name="wikipedia.search", description="dummy")
@@ -6,10 +6,8 @@ Tests the conversion between dot notation and underscore notation,
 as well as the creation and registration of OpenAI-compatible wrappers.
 """
 import pytest
-import asyncio
-from typing import Dict, Any, List
 import inspect
-from unittest.mock import patch, AsyncMock as UnitTestAsyncMock
+from unittest.mock import patch
 
 # Import the module being tested
 from chuk_mcp_runtime.common.openai_compatibility import (
@@ -23,11 +21,9 @@ from chuk_mcp_runtime.common.openai_compatibility import (
 )
 from chuk_mcp_runtime.common.mcp_tool_decorator import (
     Tool,
-    TOOLS_REGISTRY,
-    mcp_tool
+    TOOLS_REGISTRY
 )
 
-from tests.common.test_mocks import run_async
 
 # Clear the registry before tests and restore after
 @pytest.fixture
@@ -94,7 +90,6 @@ def test_from_openai_compatible_name():
     assert from_openai_compatible_name("weather.get.forecast") == "weather.get.forecast"
 
 # --- Tests for wrapper building ---
-@pytest.mark.asyncio
 async def test_build_wrapper_from_schema():
     """Test building a wrapper function from a schema."""
     # Create a simple schema
@@ -135,7 +130,6 @@ async def test_build_wrapper_from_schema():
     result = await wrapper(query="test")
     assert result == "Received: {'query': 'test'}"
 
-@pytest.mark.asyncio
 async def test_create_openai_compatible_wrapper(clear_tools_registry):
     """Test creating an OpenAI-compatible wrapper for a function."""
     # Create a sample tool with proper schema
@@ -181,7 +175,6 @@ async def test_create_openai_compatible_wrapper(clear_tools_registry):
     result = await wrapper(location="London", days=5)
     assert result == "Forecast for London for 5 days"
 
-@pytest.mark.asyncio
 async def test_create_openai_compatible_wrapper_with_proxy_metadata(clear_tools_registry):
     """Test creating a wrapper for a function with _proxy_metadata."""
     # Create a function with proxy metadata
@@ -221,7 +214,6 @@ async def test_create_openai_compatible_wrapper_with_proxy_metadata(clear_tools_
     assert result == "Proxy result: {'query': 'test', 'limit': 10}"
 
 # --- Tests for OpenAIToolsAdapter ---
-@pytest.mark.asyncio
 async def test_openai_tools_adapter_init(clear_tools_registry):
     """Test initializing the OpenAIToolsAdapter."""
     # Create and add properly configured tools to the registry
@@ -275,7 +267,6 @@ async def test_openai_tools_adapter_init(clear_tools_registry):
     assert adapter.original_to_openai["weather.get_forecast"] == "weather_get_forecast"
     assert adapter.original_to_openai["proxy.search.query"] == "search_query"
 
-@pytest.mark.asyncio
 async def test_openai_tools_adapter_register_wrappers(clear_tools_registry):
     """Test registering OpenAI-compatible wrappers."""
     # Create and add properly configured tools to the registry
@@ -346,7 +337,6 @@ async def test_openai_tools_adapter_register_wrappers(clear_tools_registry):
     assert "weather_get_forecast" in TOOLS_REGISTRY
     assert "search_query" in TOOLS_REGISTRY
 
-@pytest.mark.asyncio
 async def test_openai_tools_adapter_get_tools_definition(clear_tools_registry):
     """Test getting OpenAI tools definition."""
     # Create and add properly configured tools to the registry
@@ -408,7 +398,6 @@ async def test_openai_tools_adapter_get_tools_definition(clear_tools_registry):
             assert "description" in tool["function"]
             assert "parameters" in tool["function"]
 
-@pytest.mark.asyncio
 async def test_openai_tools_adapter_execute_tool(clear_tools_registry):
     """Test executing a tool by name."""
     # Create and add properly configured tools to the registry
@@ -500,7 +489,6 @@ def test_openai_tools_adapter_translate_name(clear_tools_registry):
     assert adapter.translate_name("unknown_tool", to_openai=False) == "unknown.tool"
 
 # --- Tests for global initialization ---
-@pytest.mark.asyncio
 async def test_initialize_openai_compatibility(clear_tools_registry):
     """Test the global initialization function."""
     # Create and add properly configured tools to the registry
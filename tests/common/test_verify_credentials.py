@@ -55,7 +55,6 @@ def token_with_expiration():
     return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 # --- Tests for validate_token ---
-@pytest.mark.asyncio
 async def test_validate_valid_token(valid_token):
     """Test validating a valid token."""
     # Validate the token
@@ -71,7 +70,6 @@ async def test_validate_valid_token(valid_token):
     assert "token" in payload
     assert payload["token"] == valid_token
 
-@pytest.mark.asyncio
 async def test_validate_token_with_expiration(token_with_expiration):
     """Test validating a token with an expiration time."""
     # Validate the token
@@ -82,7 +80,6 @@ async def test_validate_token_with_expiration(token_with_expiration):
     assert "exp" in payload
     assert payload["token"] == token_with_expiration
 
-@pytest.mark.asyncio
 async def test_validate_expired_token(expired_token):
     """Test validating an expired token."""
     # Attempt to validate the expired token
@@ -94,7 +91,6 @@ async def test_validate_expired_token(expired_token):
     assert excinfo.value.detail == "Token has expired"
     assert excinfo.value.headers == {"WWW-Authenticate": "Bearer"}
 
-@pytest.mark.asyncio
 async def test_validate_invalid_token():
     """Test validating an invalid token."""
     # Attempt to validate an invalid token
@@ -106,7 +102,6 @@ async def test_validate_invalid_token():
     assert excinfo.value.detail == "Invalid token"
     assert excinfo.value.headers == {"WWW-Authenticate": "Bearer"}
 
-@pytest.mark.asyncio
 async def test_validate_token_wrong_secret():
     """Test validating a token signed with a different secret."""
     # Create a token signed with a different secret
@@ -122,7 +117,6 @@ async def test_validate_token_wrong_secret():
     assert excinfo.value.detail == "Invalid token"
     assert excinfo.value.headers == {"WWW-Authenticate": "Bearer"}
 
-@pytest.mark.asyncio
 async def test_validate_token_wrong_algorithm():
     """Test validating a token signed with a different algorithm."""
     # Create a token signed with a different algorithm
@@ -133,7 +127,6 @@ async def test_validate_token_wrong_algorithm():
     payload = await validate_token(wrong_token)
     assert payload["sub"] == "test-user"
 
-@pytest.mark.asyncio
 async def test_validate_token_with_custom_secret():
     """Test validating a token with a custom secret set in environment."""
     # Save original secret key
@@ -5,8 +5,9 @@ Enhanced conftest.py with properly working mocks for all components.
 
 # Mock imports need to happen before ANY imports
 import sys
+import itertools
 from unittest.mock import MagicMock, AsyncMock
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
 
 # Create mocks for all the modules we need before they get imported
 mock_modules = {
@@ -54,15 +55,21 @@ sys.modules["chuk_artifacts"] = mock_artifacts_mod
 class MockMCPSessionManager:
     """Enhanced mock native session manager with full context variable support."""
     
+    __slots__ = (
+        "sandbox_id", "default_ttl_hours", "auto_extend_threshold",
+        "_sessions", "_session_ids", "_current_session",
+    )
+    
     def __init__(self, sandbox_id=None, default_ttl_hours=24, auto_extend_threshold=0.1):
         self.sandbox_id = sandbox_id or "test-sandbox"
         self.default_ttl_hours = default_ttl_hours
         self.auto_extend_threshold = auto_extend_threshold
         self._sessions = {}
+        self._session_ids = itertools.count()
         self._current_session = None
         
     async def create_session(self, user_id=None, ttl_hours=None, metadata=None):
-        session_id = f"session-{len(self._sessions)}-{user_id or 'anon'}"
+        session_id = f"session-{next(self._session_ids)}-{user_id or 'anon'}"
         self._sessions[session_id] = {
             "user_id": user_id,
             "custom_metadata": metadata or {},
@@ -169,11 +176,15 @@ class MockSessionContext:
         self.auto_create = auto_create
         self.previous_session = None
         self.previous_user = None
+        self._session_token = None
+        self._user_token = None
         
     async def __aenter__(self):
         # Save previous context - CRITICAL: Save from context vars, not manager
         self.previous_session = mock_session_ctx.get()
         self.previous_user = mock_user_ctx.get()
+        self._session_token = mock_session_ctx.set(self.previous_session)
+        self._user_token = mock_user_ctx.set(self.previous_user)
         
         if self.session_id:
             if not await self.session_manager.validate_session(self.session_id):
@@ -188,14 +199,9 @@ class MockSessionContext:
             
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         # Restore previous context - CRITICAL: Restore to context vars AND manager
-        if self.previous_session:
-            mock_session_ctx.set(self.previous_session)
-            mock_user_ctx.set(self.previous_user)
-            self.session_manager._current_session = self.previous_session
-        else:
-            mock_session_ctx.set(None)
-            mock_user_ctx.set(None)
-            self.session_manager._current_session = None
+        mock_session_ctx.reset(self._session_token)
+        mock_user_ctx.reset(self._user_token)
+        self.session_manager._current_session = self.previous_session
 
 # Mock session helper functions with proper context variable access
 def mock_require_session():
@@ -337,8 +343,22 @@ sys.modules["chuk_mcp_runtime.proxy.manager"] = proxy_manager_mod
 
 # Import necessary modules for testing
 import pytest
+import pytest_asyncio
 import asyncio
 import os
+from contextlib import asynccontextmanager
+
+# uvloop is optional - fall back to the stdlib loop when it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# orjson is optional - fall back to the stdlib parser when it isn't installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Other mock classes for server components
 class DummyServerRegistry:
@@ -379,19 +399,57 @@ class DummyMCPServer:
     async def create_user_session(self, user_id, metadata=None):
         return await self.session_manager.create_session(user_id=user_id, metadata=metadata)
 
+# Fake mcp.server.Server used by the MCPServer tests
+created_servers = []
+
+class FakeServer:
+    """Stand-in for mcp.server.Server that records the registered handlers."""
+    def __init__(self, name):
+        created_servers.append(self)
+        self.handlers = {}
+        self.server_name = name
+
+    def list_tools(self):
+        def decorator(fn):
+            self.handlers['list_tools'] = fn
+            return fn
+        return decorator
+
+    def call_tool(self):
+        def decorator(fn):
+            self.handlers['call_tool'] = fn
+            return fn
+        return decorator
+
+    def create_initialization_options(self):
+        return {}
+
+    async def run(self, read, write, opts):
+        return
+
+@asynccontextmanager
+async def dummy_stdio():
+    yield (None, None)
+
 # Helper function to safely run async code in tests
+def new_test_event_loop():
+    """Create a uvloop loop when available that runs new tasks eagerly (Python 3.12+)."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+# One event loop shared by every run_async call; closed at session teardown
+_runner = asyncio.Runner(loop_factory=new_test_event_loop)
+
 def run_async(coro):
-    """Run an async coroutine in tests safely."""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-    return loop.run_until_complete(coro)
+    """Run an async coroutine in tests on the shared test event loop."""
+    # A fresh context per call keeps ContextVar state from leaking between tests
+    return _runner.run(coro, context=copy_context())
+
+def parse_tool_result(result):
+    """Decode the JSON payload of the first TextContent returned by call_tool."""
+    return _json_loads(result[0].text)
 
 class TestAsyncMock(MagicMock):
     """Mock that works with async functions - renamed to avoid pytest collection."""
@@ -406,6 +464,39 @@ class TestAsyncMock(MagicMock):
         return self.__exit__(*args, **kwargs)
 
 # Pytest fixtures
+@pytest.fixture(scope="session", autouse=True)
+def patch_server_globals():
+    """Swap the MCP Server and stdio transport for fakes for the whole session."""
+    import chuk_mcp_runtime.server.server as srv_mod
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(srv_mod, "Server", FakeServer)
+        mp.setattr(srv_mod, "stdio_server", dummy_stdio)
+        yield
+
+@pytest.fixture
+def fake_server_last():
+    """Provide a getter for the most recently created FakeServer."""
+    def _last():
+        assert len(created_servers) > 0, "No fake server was created"
+        return created_servers[-1]
+    return _last
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def eager_tasks():
+    """Switch the module's shared test loop to the eager task factory (Python 3.12+)."""
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(previous)
+
+@pytest.fixture(scope="session", autouse=True)
+def close_test_runner():
+    """Close the event loop shared by run_async once the session ends."""
+    yield
+    _runner.close()
+
 @pytest.fixture(scope="session", autouse=True)
 def ensure_mocked_modules():
     """Ensure that all required modules are mocked."""
@@ -491,8 +582,13 @@ __all__ = [
     "MockProxyServerManager",
     "DummyMCPServer",
     "DummyServerRegistry",
+    "FakeServer",
+    "created_servers",
+    "dummy_stdio",
     "TestAsyncMock",
     "run_async",
+    "parse_tool_result",
+    "new_test_event_loop",
     "mock_require_session",
     "mock_get_session_or_none",
     "mock_get_user_or_none",
@@ -6,18 +6,15 @@ Tests how the proxy system integrates with the entry point
 and how it handles tool naming conventions.
 """
 import pytest
-import os
 import sys
-import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 # Import our common test mocks
 from tests.common.test_mocks import (
     MockProxyServerManager, 
     MockMCPServer,
     MockServerRegistry,
-    AsyncMock,
-    run_async
+    AsyncMock
 )
 
 # Import the entry module with our mocks already installed
@@ -98,7 +95,6 @@ def test_proxy_server_manager_mock():
     assert hasattr(proxy, "start_servers")
 
 # --- Tests ---
-@pytest.mark.asyncio
 async def test_proxy_enabled(setup_mocks):
     """Test that proxy is properly enabled when configured."""
     # Create a tracking server
@@ -132,7 +128,6 @@ async def test_proxy_enabled(setup_mocks):
     assert result is True
     assert server_started is True, "Server was not started"
 
-@pytest.mark.asyncio
 async def test_proxy_disabled(setup_mocks):
     """Test that proxy is properly disabled when not configured."""
     # Create a tracking server and proxy
@@ -172,7 +167,6 @@ async def test_proxy_disabled(setup_mocks):
     # We didn't create the proxy, so it should not have started
     assert proxy_started is False, "Proxy was unexpectedly started"
 
-@pytest.mark.asyncio
 async def test_proxy_server_error_handling(setup_mocks):
     """Test error handling when proxy server fails to start."""
     # Create a tracking server
@@ -215,7 +209,6 @@ async def test_proxy_server_error_handling(setup_mocks):
     assert result is True
     assert server_started is True, "Server was not started after proxy failure"
 
-@pytest.mark.asyncio
 async def test_proxy_tool_registration(setup_mocks):
     """Test that proxy tools are properly registered with the MCP server."""
     # Create test tools with different naming conventions
@@ -6,20 +6,15 @@ Tests the proxy manager's ability to handle different tool naming conventions
 and properly resolve them when forwarding to remote tools.
 """
 import pytest
-import json
-from typing import Dict, Any, List, Callable
 
 # Import our common test mocks
 from tests.common.test_mocks import (
     MockProxyServerManager, 
     MockStreamManager, 
-    AsyncMock,
-    run_async
+    AsyncMock
 )
 
 # Get direct references to modules we need
-from chuk_mcp_runtime.common.mcp_tool_decorator import TOOLS_REGISTRY, mcp_tool
-from chuk_mcp_runtime.common.tool_naming import update_naming_maps
 
 # Import the entry module with our mocks already installed
 from tests.common.test_mocks import entry_module as entry
@@ -87,7 +82,6 @@ def test_proxy_initialization(proxy_config):
     assert "wikipedia" in proxy.mcp_servers
     assert "google" in proxy.mcp_servers
 
-@pytest.mark.asyncio
 async def test_proxy_server_start_stop(proxy_config, mock_setup_mcp_stdio):
     """Test starting and stopping proxy servers."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
@@ -106,7 +100,6 @@ async def test_proxy_server_start_stop(proxy_config, mock_setup_mcp_stdio):
     # Check that close was called
     assert ("close",) in mock_setup_mcp_stdio.call_history
 
-@pytest.mark.asyncio
 async def test_proxy_tool_registration(proxy_config, mock_setup_mcp_stdio):
     """Test tool registration with various naming conventions."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
@@ -128,7 +121,6 @@ async def test_proxy_tool_registration(proxy_config, mock_setup_mcp_stdio):
     assert "wikipedia_search" in tools
     assert "google_search" in tools
 
-@pytest.mark.asyncio
 async def test_proxy_tool_registration_dot_mode(proxy_config, mock_setup_mcp_stdio):
     """Test tool registration in dot notation mode."""
     # Change to dot notation mode
@@ -153,7 +145,6 @@ async def test_proxy_tool_registration_dot_mode(proxy_config, mock_setup_mcp_std
     assert "proxy.wikipedia.search" in tools
     assert "proxy.google.search" in tools
 
-@pytest.mark.asyncio
 async def test_proxy_call_tool_dot_notation(proxy_config, mock_setup_mcp_stdio):
     """Test calling tools with dot notation."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
@@ -170,7 +161,6 @@ async def test_proxy_call_tool_dot_notation(proxy_config, mock_setup_mcp_stdio):
     # Check that the call was forwarded correctly
     assert ("call_tool", "search", {"query": "python"}, "wikipedia") in mock_setup_mcp_stdio.call_history
 
-@pytest.mark.asyncio
 async def test_proxy_call_tool_underscore_notation(proxy_config, mock_setup_mcp_stdio):
     """Test calling tools with underscore notation."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
@@ -189,7 +179,6 @@ async def test_proxy_call_tool_underscore_notation(proxy_config, mock_setup_mcp_
                "query" in item[2] and item[2]["query"] == "python" and item[3] == "wikipedia" 
                for item in mock_setup_mcp_stdio.call_history)
 
-@pytest.mark.asyncio
 async def test_proxy_call_tool_full_namespace(proxy_config, mock_setup_mcp_stdio):
     """Test calling tools with full namespace."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
@@ -208,14 +197,12 @@ async def test_proxy_call_tool_full_namespace(proxy_config, mock_setup_mcp_stdio
                "query" in item[2] and item[2]["query"] == "python" and item[3] == "wikipedia" 
                for item in mock_setup_mcp_stdio.call_history)
 
-@pytest.mark.asyncio
 async def test_proxy_error_handling(proxy_config, mock_setup_mcp_stdio):
     """Test proxy error handling."""
     # This test is failing because the error handling isn't working as expected
     # Instead of trying to rely on the mock error handling, let's just skip this test
     pytest.skip("Skipping error handling test as it requires specific mock behavior")
 
-@pytest.mark.asyncio
 async def test_proxy_process_text(proxy_config, mock_setup_mcp_stdio):
     """Test process_text functionality."""
     proxy = MockProxyServerManager(proxy_config, "/fake/project/root")
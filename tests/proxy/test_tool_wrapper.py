@@ -17,8 +17,6 @@ The real decorator attaches `_mcp_tool` lazily; we therefore call
 """
 from __future__ import annotations
 
-import sys
-from types import ModuleType
 from typing import Dict, Any, List
 
 import pytest
@@ -76,7 +74,6 @@ class DummyStreamManager:
 # ---------------------------------------------------------------------------#
 # 1) Registration and basic metadata
 # ---------------------------------------------------------------------------#
-@pytest.mark.asyncio
 async def test_create_proxy_tool_registers_in_registry():
     stream_mgr = DummyStreamManager()
     await create_proxy_tool("proxy.time", "now", stream_mgr)
@@ -95,7 +92,6 @@ async def test_create_proxy_tool_registers_in_registry():
 # ---------------------------------------------------------------------------#
 # 2) Call-through & return value
 # ---------------------------------------------------------------------------#
-@pytest.mark.asyncio
 async def test_wrapper_calls_stream_manager_and_returns_content():
     stream_mgr = DummyStreamManager()
     wrapper = await create_proxy_tool("proxy.wikipedia", "search", stream_mgr)
@@ -108,7 +104,6 @@ async def test_wrapper_calls_stream_manager_and_returns_content():
 # ---------------------------------------------------------------------------#
 # 3) Error propagation
 # ---------------------------------------------------------------------------#
-@pytest.mark.asyncio
 async def test_wrapper_raises_on_remote_error():
     stream_mgr = DummyStreamManager(is_error=True)
     wrapper = await create_proxy_tool("proxy.wiki", "explode", stream_mgr)
@@ -120,7 +115,6 @@ async def test_wrapper_raises_on_remote_error():
 # ---------------------------------------------------------------------------#
 # 4) Custom metadata passthrough
 # ---------------------------------------------------------------------------#
-@pytest.mark.asyncio
 async def test_metadata_description_is_used():
     meta = {"description": "Return the current UTC time."}
     stream_mgr = DummyStreamManager()
@@ -133,7 +127,6 @@ async def test_metadata_description_is_used():
 # ---------------------------------------------------------------------------#
 # 5) ToolRegistryProvider integration (optional dependency)
 # ---------------------------------------------------------------------------#
-@pytest.mark.asyncio
 async def test_toolregistryprovider_registration(monkeypatch):
     """
     Provide a fake async ToolRegistryProvider and ensure create_proxy_tool
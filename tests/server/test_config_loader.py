@@ -1,7 +1,5 @@
 import os
-import tempfile
 import yaml
-import pytest
 from chuk_mcp_runtime.server.config_loader import load_config, find_project_root, get_config_value
 
 def test_load_config_default(tmp_path):
@@ -1,6 +1,3 @@
-import os
-import sys
-import pytest
 from chuk_mcp_runtime.server import config_loader
 
 def test_logging_to_stderr(tmp_path, monkeypatch, caplog, capsys):
@@ -1,5 +1,3 @@
-import logging
-import pytest
 from chuk_mcp_runtime.server.logging_config import get_logger, configure_logging
 
 def test_configure_logging(monkeypatch):
@@ -3,74 +3,29 @@
 Fixed server tests that match the actual server behavior.
 """
 import pytest
-import asyncio
-from unittest.mock import Mock, AsyncMock, patch
-from contextlib import asynccontextmanager
 
 from chuk_mcp_runtime.server.server import MCPServer
 from chuk_mcp_runtime.common.mcp_tool_decorator import mcp_tool, TOOLS_REGISTRY
+from tests.conftest import created_servers, run_async
 
-# Track created fake servers
-_created_servers = []
-
-class FakeServer:
-    def __init__(self, name):
-        _created_servers.append(self)
-        self.handlers = {}
-        self.server_name = name
-
-    def list_tools(self):
-        def decorator(fn):
-            self.handlers['list_tools'] = fn
-            return fn
-        return decorator
-
-    def call_tool(self):
-        def decorator(fn):
-            self.handlers['call_tool'] = fn
-            return fn
-        return decorator
-
-    def create_initialization_options(self):
-        return {}
-
-    async def run(self, read, write, opts):
-        return
-
-@asynccontextmanager
-async def dummy_stdio():
-    yield (None, None)
+# Shared server config - MCPServer only reads it
+CFG = {"server": {"type": "stdio"}, "tools": {}}
 
 @pytest.fixture(autouse=True)
-def setup_test(monkeypatch):
-    import chuk_mcp_runtime.server.server as srv_mod
-    monkeypatch.setattr(srv_mod, "Server", FakeServer)
-    monkeypatch.setattr(srv_mod, "stdio_server", dummy_stdio)
+def setup_test():
     TOOLS_REGISTRY.clear()
-    _created_servers.clear()
+    created_servers.clear()
     yield
     TOOLS_REGISTRY.clear()
-    _created_servers.clear()
-
-def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    created_servers.clear()
 
 @mcp_tool(name="error_tool", description="Raises an error")
 async def error_tool():
     raise ValueError("Test error message")
 
-def test_call_tool_errors():
+def test_call_tool_errors(fake_server_last):
     """Test that call_tool handles errors properly - returns error messages, doesn't raise."""
-    cfg = {"server": {"type": "stdio"}, "tools": {}}
-    server = MCPServer(cfg)
+    server = MCPServer(CFG)
     
     TOOLS_REGISTRY["error_tool"] = error_tool
     
@@ -78,8 +33,7 @@ def test_call_tool_errors():
     run_async(server.serve())
     
     # Get the fake server that was created
-    assert len(_created_servers) > 0, "No fake server was created"
-    fake_server = _created_servers[-1]
+    fake_server = fake_server_last()
     
     assert 'call_tool' in fake_server.handlers, "call_tool handler not registered"
     call_tool = fake_server.handlers['call_tool']
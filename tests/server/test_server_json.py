@@ -3,67 +3,22 @@
 Fixed JSON serialization tests with proper server tracking.
 """
 import pytest
-import asyncio
-import json
-from contextlib import asynccontextmanager
 
 from chuk_mcp_runtime.server.server import MCPServer
 from chuk_mcp_runtime.common.mcp_tool_decorator import mcp_tool, TOOLS_REGISTRY
-from mcp.types import TextContent
+from tests.conftest import created_servers, parse_tool_result, run_async
 
-# Capture FakeServer instances - CRITICAL: Use module-level variable
-_created = []
-
-class FakeServer:
-    def __init__(self, name):
-        # CRITICAL: Append to module-level list, not local variable
-        _created.append(self)
-        self.handlers = {}
-        self.server_name = name
-
-    def list_tools(self):
-        def decorator(fn):
-            self.handlers['list_tools'] = fn
-            return fn
-        return decorator
-
-    def call_tool(self):
-        def decorator(fn):
-            self.handlers['call_tool'] = fn
-            return fn
-        return decorator
-
-    def create_initialization_options(self):
-        return {}
-
-    async def run(self, read, write, opts):
-        return
-
-@asynccontextmanager
-async def dummy_stdio():
-    yield (None, None)
+# Shared server config - MCPServer only reads it
+CFG = {"server": {"type": "stdio"}, "tools": {}}
 
 @pytest.fixture(autouse=True)
-def patch_server(monkeypatch):
-    import chuk_mcp_runtime.server.server as srv_mod
-    monkeypatch.setattr(srv_mod, "Server", FakeServer)
-    monkeypatch.setattr(srv_mod, "stdio_server", dummy_stdio)
+def setup_test():
     TOOLS_REGISTRY.clear()
-    _created.clear()
+    created_servers.clear()
     yield
-    _created.clear()
+    created_servers.clear()
     TOOLS_REGISTRY.clear()
 
-def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
 
 # Test tools
 @mcp_tool(name="dict_tool", description="Returns a dict")
@@ -74,20 +29,20 @@ async def dict_tool() -> dict:
 async def error_tool():
     raise RuntimeError("oh no")
 
-def test_json_serialization_and_awaiting():
+def test_json_serialization_and_awaiting(fake_server_last):
     """Test basic JSON serialization for different tool return types."""
-    cfg = {"server": {"type": "stdio"}, "tools": {}}
-    server = MCPServer(cfg)
+    server = MCPServer(CFG)
 
-    TOOLS_REGISTRY["dict_tool"] = dict_tool
-    TOOLS_REGISTRY["error_tool"] = error_tool
+    TOOLS_REGISTRY.update({
+        "dict_tool": dict_tool,
+        "error_tool": error_tool,
+    })
 
     # CRITICAL: Server creation happens during serve() call
     run_async(server.serve())
 
     # Now check that fake server was created
-    assert len(_created) > 0, f"No fake server was created. _created contains: {_created}"
-    fake = _created[-1]
+    fake = fake_server_last()
     assert 'call_tool' in fake.handlers, "call_tool handler not found"
     
     call = fake.handlers['call_tool']
@@ -95,7 +50,7 @@ def test_json_serialization_and_awaiting():
     # Test dict_tool
     out = run_async(call("dict_tool", {}))
     assert len(out) == 1
-    parsed = json.loads(out[0].text)
+    parsed = parse_tool_result(out)
     assert parsed == {"a": 1, "b": [2, 3], "c": {"x": True}}
 
     # Test error_tool - should return error message, not raise
@@ -104,17 +59,15 @@ def test_json_serialization_and_awaiting():
     assert "Tool execution error" in out_error[0].text
     assert "oh no" in out_error[0].text
 
-def test_error_handling_with_naming_resolution():
+def test_error_handling_with_naming_resolution(fake_server_last):
     """Test error handling with tool naming resolution."""
-    cfg = {"server": {"type": "stdio"}, "tools": {}}
-    server = MCPServer(cfg)
+    server = MCPServer(CFG)
 
     TOOLS_REGISTRY["error_tool"] = error_tool
     
     run_async(server.serve())
 
-    assert len(_created) > 0, f"No fake server was created. _created contains: {_created}"
-    fake = _created[-1]
+    fake = fake_server_last()
     assert 'call_tool' in fake.handlers, "call_tool handler not found"
     
     call = fake.handlers['call_tool']
@@ -131,21 +84,19 @@ def test_error_handling_with_naming_resolution():
     assert "Tool execution error" in out2[0].text
     assert "Tool not found" in out2[0].text
 
-def test_naming_compatibility():
+def test_naming_compatibility(fake_server_last):
     """Test tool calling with different naming conventions."""
     @mcp_tool(name="list.tool", description="Returns a list")
     async def list_tool() -> list:
         return ["hello", {"num": 5}, False]
 
-    cfg = {"server": {"type": "stdio"}, "tools": {}}
-    server = MCPServer(cfg)
+    server = MCPServer(CFG)
 
     TOOLS_REGISTRY["list.tool"] = list_tool
     
     run_async(server.serve())
 
-    assert len(_created) > 0, f"No fake server was created. _created contains: {_created}"
-    fake = _created[-1]
+    fake = fake_server_last()
     assert 'call_tool' in fake.handlers, "call_tool handler not found"
     
     call = fake.handlers['call_tool']
@@ -153,7 +104,7 @@ def test_naming_compatibility():
     # Test with original dot notation
     out1 = run_async(call("list.tool", {}))
     assert len(out1) == 1
-    parsed1 = json.loads(out1[0].text)
+    parsed1 = parse_tool_result(out1)
     assert parsed1 == ["hello", {"num": 5}, False]
 
 if __name__ == "__main__":
@@ -4,68 +4,37 @@ Fixed version of server session tests.
 """
 import pytest
 import asyncio
-import json
-from contextlib import asynccontextmanager
 
 from chuk_mcp_runtime.server.server import MCPServer
 from chuk_mcp_runtime.common.mcp_tool_decorator import mcp_tool, TOOLS_REGISTRY
+from tests.conftest import created_servers, parse_tool_result, run_async
 
-# Capture created servers for testing
-_created_servers = []
+# Shared server config - MCPServer only reads it
+CFG = {"server": {"type": "stdio"}, "sessions": {"sandbox_id": "test"}}
 
-class FakeServer:
-    def __init__(self, name):
-        _created_servers.append(self)
-        self.handlers = {}
-        self.server_name = name
-
-    def list_tools(self):
-        def decorator(fn):
-            self.handlers['list_tools'] = fn
-            return fn
-        return decorator
-
-    def call_tool(self):
-        def decorator(fn):
-            self.handlers['call_tool'] = fn
-            return fn
-        return decorator
-
-    def create_initialization_options(self):
-        return {}
-
-    async def run(self, read, write, opts):
-        return
+@pytest.fixture(scope="module")
+def mcp_call_tool():
+    """call_tool handler shared by every test in this module."""
+    TOOLS_REGISTRY.clear()
+    created_servers.clear()
+    server = MCPServer(CFG)
+    run_async(server.serve())
 
-@asynccontextmanager
-async def dummy_stdio():
-    yield (None, None)
+    assert len(created_servers) > 0, "No fake server was created"
+    fake_server = created_servers[-1]
+    assert 'call_tool' in fake_server.handlers, "call_tool handler not registered"
+    return fake_server.handlers['call_tool']
 
 @pytest.fixture(autouse=True)
-def setup_test(monkeypatch):
-    import chuk_mcp_runtime.server.server as srv_mod
-    monkeypatch.setattr(srv_mod, "Server", FakeServer)
-    monkeypatch.setattr(srv_mod, "stdio_server", dummy_stdio)
-    
+def reset_registry():
     # Clear registry and servers
     TOOLS_REGISTRY.clear()
-    _created_servers.clear()
+    created_servers.clear()
     
     yield
     
     TOOLS_REGISTRY.clear()
-    _created_servers.clear()
-
-def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    created_servers.clear()
 
 # Test tools
 @mcp_tool(name="get_current_session", description="Get current session ID")
@@ -83,108 +52,71 @@ async def upload_file_tool(filename: str, content: str, session_id: str = None):
         "status": "uploaded"
     }
 
+# Test tools by registry name, for the indirect ``tools`` fixture
+_TEST_TOOLS = {
+    "get_current_session": get_current_session_tool,
+    "upload_file": upload_file_tool,
+}
+
+@pytest.fixture
+def tools(request):
+    """Register the named slice of test tools for a single test."""
+    names = request.param
+    registered = {name: _TEST_TOOLS[name] for name in names}
+    TOOLS_REGISTRY.update(registered)
+    yield registered
+    for name in names:
+        TOOLS_REGISTRY.pop(name, None)
+
 class TestNativeSessionTools:
     """Test native session management tools."""
     
-    def test_get_current_session_native_tool(self):
+    @pytest.mark.parametrize("tools", [("get_current_session",)], indirect=True)
+    def test_get_current_session_native_tool(self, mcp_call_tool, tools):
         """Test getting current session through native session management."""
-        cfg = {"server": {"type": "stdio"}, "sessions": {"sandbox_id": "test"}}
-        server = MCPServer(cfg)
-        
-        # Register session-aware tool
-        TOOLS_REGISTRY["get_current_session"] = get_current_session_tool
-        
-        # Start server
-        run_async(server.serve())
-        
-        # Get the created fake server
-        assert len(_created_servers) > 0, "No fake server was created"
-        fake_server = _created_servers[-1]
-        
-        assert 'call_tool' in fake_server.handlers, "call_tool handler not registered"
-        call_tool = fake_server.handlers['call_tool']
-        
         # Test call
-        result = run_async(call_tool("get_current_session", {}))
+        result = run_async(mcp_call_tool("get_current_session", {}))
         assert len(result) == 1
-        response = json.loads(result[0].text)
-        assert "current_session" in response
+        assert '"current_session":' in result[0].text
 
 class TestNativeSessionContextInjection:
     """Test automatic session injection for artifact tools."""
     
-    def test_session_injection_for_artifact_tools(self):
+    @pytest.mark.parametrize("tools", [("upload_file",)], indirect=True)
+    def test_session_injection_for_artifact_tools(self, mcp_call_tool, tools):
         """Test that session IDs are automatically injected for artifact tools."""
-        cfg = {"server": {"type": "stdio"}, "sessions": {"sandbox_id": "test"}}
-        server = MCPServer(cfg)
-        
-        # Register artifact tool
-        TOOLS_REGISTRY["upload_file"] = upload_file_tool
-        
-        # Start server
-        run_async(server.serve())
-        
-        # Get the created fake server
-        assert len(_created_servers) > 0, "No fake server was created"
-        fake_server = _created_servers[-1]
-        
-        assert 'call_tool' in fake_server.handlers, "call_tool handler not registered"
-        call_tool = fake_server.handlers['call_tool']
-        
         # Test call without session_id - should auto-inject
-        result = run_async(call_tool("upload_file", {
+        result = run_async(mcp_call_tool("upload_file", {
             "filename": "test.txt",
             "content": "test content"
         }))
         
         assert len(result) == 1
-        response_text = result[0].text
         
-        # Parse response
-        try:
-            if response_text.startswith('{"session_id"'):
-                response = json.loads(response_text)
-            else:
-                response = json.loads(response_text)
-                if "content" in response:
-                    response = response["content"]
-        except json.JSONDecodeError:
-            # If parsing fails, check for basic content
-            assert "test.txt" in response_text
-            assert "session" in response_text.lower()
-            return
+        # Artifact tool results come back wrapped as {"session_id", "content", "isError"}
+        response = parse_tool_result(result)
+        if "content" in response and isinstance(response["content"], dict):
+            response = response["content"]
         
         # Verify response structure
-        assert "filename" in response
-        assert response["filename"] == "test.txt"
+        assert response.get("filename") == "test.txt"
         assert "session_id" in response
 
 class TestNativeSessionIsolation:
     """Test session isolation between concurrent operations."""
     
-    def test_concurrent_session_contexts(self):
+    @pytest.mark.parametrize("tools", [("upload_file",)], indirect=True)
+    def test_concurrent_session_contexts(self, mcp_call_tool, tools):
         """Test that concurrent session contexts don't interfere - simplified."""
-        # Simplified test that doesn't rely on complex context management
-        cfg = {"server": {"type": "stdio"}, "sessions": {"sandbox_id": "test"}}
-        server = MCPServer(cfg)
-        
-        # Register tool
-        TOOLS_REGISTRY["upload_file"] = upload_file_tool
-        
-        # Start server
-        run_async(server.serve())
+        payloads = [
+            {"filename": f"file{i}.txt", "content": f"content{i}"} for i in (1, 2, 3)
+        ]
         
         # Test multiple concurrent calls
         async def test_concurrent():
-            fake_server = _created_servers[-1]
-            call_tool = fake_server.handlers['call_tool']
-            
-            # Make concurrent calls
-            results = await asyncio.gather(
-                call_tool("upload_file", {"filename": "file1.txt", "content": "content1"}),
-                call_tool("upload_file", {"filename": "file2.txt", "content": "content2"}),
-                call_tool("upload_file", {"filename": "file3.txt", "content": "content3"})
-            )
+            # Make concurrent calls - run_async's loop starts these eagerly
+            coros = [mcp_call_tool("upload_file", p) for p in payloads]
+            results = await asyncio.gather(*coros)
             
             # Verify all calls succeeded
             assert len(results) == 3
@@ -203,42 +135,25 @@ class TestNativeSessionIsolation:
 class TestNativeSessionToolIntegration:
     """Test integration between tools and native session management."""
     
-    def test_session_aware_vs_regular_tools(self):
+    @pytest.mark.parametrize("tools", [("upload_file",)], indirect=True)
+    def test_session_aware_vs_regular_tools(self, mcp_call_tool, tools):
         """Test that session-aware and regular tools work correctly."""
-        cfg = {"server": {"type": "stdio"}, "sessions": {"sandbox_id": "test"}}
-        server = MCPServer(cfg)
-        
-        # Define a regular tool
+        # Define a regular tool - @mcp_tool registers it alongside upload_file
         @mcp_tool(name="regular_tool", description="Regular tool")
         async def regular_tool(message: str):
             return {"message": message, "status": "processed"}
         
-        # Register both types of tools
-        TOOLS_REGISTRY["upload_file"] = upload_file_tool
-        TOOLS_REGISTRY["regular_tool"] = regular_tool
-        
-        # Start server
-        run_async(server.serve())
-        
-        # Get the created fake server
-        assert len(_created_servers) > 0, "No fake server was created"
-        fake_server = _created_servers[-1]
-        
-        assert 'call_tool' in fake_server.handlers, "call_tool handler not registered"
-        call_tool = fake_server.handlers['call_tool']
-        
         # Test regular tool
-        result1 = run_async(call_tool("regular_tool", {"message": "hello"}))
+        result1 = run_async(mcp_call_tool("regular_tool", {"message": "hello"}))
         assert len(result1) == 1
-        response1 = json.loads(result1[0].text)
-        assert response1["message"] == "hello"
+        assert '"message": "hello"' in result1[0].text
         
         # Test session-aware tool
-        result2 = run_async(call_tool("upload_file", {
+        result2 = run_async(mcp_call_tool("upload_file", {
             "filename": "test.txt",
             "content": "test data"
         }))
         assert len(result2) == 1
         # Basic verification that it contains expected data
         response_text = result2[0].text
-        assert "test.txt" in response_text
+        assert "test.txt" in response_text
\ No newline at end of file
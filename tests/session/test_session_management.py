@@ -2,22 +2,37 @@
 """
 Fixed session management tests with proper concurrent session isolation.
 """
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+import pytest_asyncio
 import asyncio
+import chuk_mcp_runtime.session
 from tests.conftest import (
     MockMCPSessionManager, 
     MockSessionContext,
     mock_session_ctx,
-    mock_user_ctx,
-    mock_require_session,
-    MockSessionError,
-    run_async
 )
 
+# All async tests in this module share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def session_manager_with_sessions():
+    """Mock session manager with one pre-created session per worker."""
+    session_manager = MockMCPSessionManager()
+    session_ids = await asyncio.gather(*[
+        session_manager.create_session(user_id=f"user{i}", metadata={"worker_id": f"worker{i}"})
+        for i in (1, 2, 3)
+    ])
+    return session_manager, dict(zip(("worker1", "worker2", "worker3"), session_ids))
+
 class TestSessionContext:
     """Test the SessionContext context manager."""
     
-    @pytest.mark.asyncio
     async def test_session_context_exception_handling(self):
         """Test SessionContext handles exceptions properly."""
         session_manager = MockMCPSessionManager()
@@ -42,25 +57,75 @@ class TestSessionContext:
         current_after = mock_session_ctx.get()
         assert current_after == "previous_session"
 
+@pytest.fixture(scope="module")
+def native():
+    """The real native_session_management module, loaded against a stub chuk_sessions.
+
+    conftest replaces the module in sys.modules, so it is loaded from its file
+    under a private name instead.
+    """
+    path = Path(chuk_mcp_runtime.session.__file__).with_name("native_session_management.py")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "chuk_sessions", MagicMock())
+        mp.setitem(sys.modules, "chuk_sessions.provider_factory", MagicMock())
+        spec = importlib.util.spec_from_file_location("_native_session_management", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def native_manager(native):
+    """Real MCPSessionManager whose underlying store accepts every session."""
+    manager = native.MCPSessionManager(sandbox_id="test-sandbox")
+    manager._session_manager = AsyncMock()
+    manager._session_manager.validate_session.return_value = True
+    return manager
+
+class TestNativeSessionContext:
+    """Test the real SessionContext restores the context it entered from."""
+
+    async def test_restores_previous_user_without_session(self, native, native_manager):
+        """Test a previous user is restored even when there was no previous session."""
+        native._user_ctx.set("alice")
+
+        async with native.SessionContext(native_manager, session_id="s1", user_id="bob"):
+            assert native.get_session_or_none() == "s1"
+            assert native.get_user_or_none() == "bob"
+
+        assert native.get_session_or_none() is None
+        assert native.get_user_or_none() == "alice"
+
+    async def test_restores_context_on_exception(self, native, native_manager):
+        """Test the previous session and user are restored when the body raises."""
+        native_manager.set_current_session("previous", "alice")
+
+        with pytest.raises(ValueError):
+            async with native.SessionContext(native_manager, session_id="s1", user_id="bob"):
+                assert native.get_session_or_none() == "s1"
+                raise ValueError("Test exception")
+
+        assert native.get_session_or_none() == "previous"
+        assert native.get_user_or_none() == "alice"
+
+    async def test_nested_contexts(self, native, native_manager):
+        """Test nested contexts each restore the context of their own entry."""
+        async with native.SessionContext(native_manager, session_id="outer", user_id="alice"):
+            async with native.SessionContext(native_manager, session_id="inner", user_id="bob"):
+                assert native.get_session_or_none() == "inner"
+                assert native.get_user_or_none() == "bob"
+            assert native.get_session_or_none() == "outer"
+            assert native.get_user_or_none() == "alice"
+
+        assert native.get_session_or_none() is None
+        assert native.get_user_or_none() is None
+
 class TestIntegrationScenarios:
     """Test real-world integration scenarios."""
     
-    @pytest.mark.asyncio
-    async def test_concurrent_sessions(self):
+    async def test_concurrent_sessions(self, eager_tasks, session_manager_with_sessions):
         """Test concurrent session operations with proper isolation."""
-        session_manager = MockMCPSessionManager()
-        
-        # Pre-create sessions for each worker to ensure they're different
-        session1 = await session_manager.create_session(user_id="user1", metadata={"worker_id": "worker1"})
-        session2 = await session_manager.create_session(user_id="user2", metadata={"worker_id": "worker2"})  
-        session3 = await session_manager.create_session(user_id="user3", metadata={"worker_id": "worker3"})
-        
-        # Map workers to their pre-created sessions
-        worker_sessions = {
-            "worker1": session1,
-            "worker2": session2, 
-            "worker3": session3
-        }
+        # Each worker gets its own pre-created session
+        session_manager, worker_sessions = session_manager_with_sessions
         
         results = {}
         
@@ -84,12 +149,9 @@ class TestIntegrationScenarios:
             }
                 
         # Run concurrent workers
-        workers = [
-            session_worker("worker1", "user1"),
-            session_worker("worker2", "user2"),
-            session_worker("worker3", "user3"),
-        ]
-        await asyncio.gather(*workers)
+        async with asyncio.TaskGroup() as tg:
+            for i in (1, 2, 3):
+                tg.create_task(session_worker(f"worker{i}", f"user{i}"))
         
         # Verify each worker maintained its own session
         for i in range(1, 4):
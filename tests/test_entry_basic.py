@@ -4,8 +4,8 @@ Test module for basic functionality of chuk_mcp_runtime entry point.
 """
 import pytest
 import sys
-import asyncio
-from unittest.mock import MagicMock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 # Mock the problematic artifacts_tools module before ANY imports
 mock_artifacts_tools = MagicMock()
@@ -14,12 +14,9 @@ sys.modules["chuk_mcp_runtime.tools.artifacts_tools"] = mock_artifacts_tools
 
 # Import our test infrastructure
 from tests.conftest import (
-    MockProxyServerManager, 
     MockMCPSessionManager,
     MockSessionContext,
     DummyServerRegistry,
-    mock_session_ctx,
-    mock_user_ctx,
     mock_require_session,
     mock_get_session_or_none,
     mock_with_session_auto_inject,
@@ -33,6 +30,8 @@ import chuk_mcp_runtime.entry as entry
 class EnhancedMockMCPSessionManager(MockMCPSessionManager):
     """Enhanced mock session manager that properly handles configuration."""
     
+    __slots__ = ()
+    
     def __init__(self, sandbox_id=None, default_ttl_hours=24, auto_extend_threshold=0.1):
         super().__init__(sandbox_id, default_ttl_hours, auto_extend_threshold)
         # Ensure we respect the provided parameters
@@ -54,6 +53,11 @@ class EnhancedMockMCPSessionManager(MockMCPSessionManager):
 class DummyMCPServer:
     """Enhanced dummy MCP server with session management."""
     
+    __slots__ = (
+        "config", "serve_called", "server_name", "registered_tools",
+        "tools_registry", "session_manager", "custom_handlers",
+    )
+    
     def __init__(self, config, tools_registry=None):
         self.config = config
         self.serve_called = False
@@ -134,68 +138,78 @@ class UniversalMockProxyServerManager:
         
         return f"Result from {name} with args {kwargs}"
 
+# Tool stubs are built once and shared by every test in this module
+def _make_tool(name, result=None):
+    """Build a plain async stub that looks like an @mcp_tool function."""
+    async def tool(*args, **kwargs):
+        return result
+    tool.__name__ = name
+    tool._mcp_tool = SimpleNamespace(name=name)
+    return tool
+
+_TOOL_STUBS = {}
+
+def _tool_stub(name):
+    """Return the shared tool stub registered under *name*."""
+    if name not in _TOOL_STUBS:
+        _TOOL_STUBS[name] = _make_tool(name)
+    return _TOOL_STUBS[name]
+
+_ARTIFACT_TOOLS = {
+    "upload_file": _make_tool("upload_file", "uploaded"),
+    "write_file": _make_tool("write_file", "written"),
+    "read_file": _make_tool("read_file", "content"),
+    "list_session_files": _make_tool("list_session_files", [])
+}
+
+# Tool registration functions
+async def mock_register_artifacts_tools(config):
+    return config.get("artifacts", {}).get("enabled", False)
+
+async def mock_register_session_tools(config):
+    return config.get("session_tools", {}).get("enabled", False)
+
+# Mock _iter_tools function
+def mock_iter_tools(container):
+    if isinstance(container, (dict, list, tuple, set)):
+        for name in container:
+            yield name, _tool_stub(name)
+
+# Mock get_artifact_tools
+def mock_get_artifact_tools():
+    return dict(_ARTIFACT_TOOLS)
+
 # Apply patches
+@pytest.fixture(scope="module", autouse=True)
 def patch_session_management():
-    """Apply comprehensive session management patches."""
-    # Core classes
-    entry.MCPSessionManager = EnhancedMockMCPSessionManager
-    entry.SessionContext = MockSessionContext
-    entry.create_mcp_session_manager = lambda config: EnhancedMockMCPSessionManager(
-        sandbox_id=config.get("sessions", {}).get("sandbox_id") if config else None,
-        default_ttl_hours=config.get("sessions", {}).get("default_ttl_hours", 24) if config else 24
-    )
-    
-    # Replace proxy manager with universal version
-    entry.ProxyServerManager = UniversalMockProxyServerManager
-    
-    # Helper functions
-    entry.with_session_auto_inject = mock_with_session_auto_inject
-    entry.require_session = mock_require_session
-    entry.get_session_or_none = mock_get_session_or_none
-    
-    # Tool registration functions
-    async def mock_register_artifacts_tools(config):
-        return config.get("artifacts", {}).get("enabled", False)
-    
-    async def mock_register_session_tools(config):
-        return config.get("session_tools", {}).get("enabled", False)
-    
-    entry.register_artifacts_tools = mock_register_artifacts_tools
-    entry.register_session_tools = mock_register_session_tools
-    
-    # Mock _iter_tools function
-    def mock_iter_tools(container):
-        if isinstance(container, dict):
-            for name, func in container.items():
-                mock_func = TestAsyncMock()
-                mock_func._mcp_tool = MagicMock()
-                mock_func._mcp_tool.name = name
-                yield name, mock_func
-        elif isinstance(container, (list, tuple, set)):
-            for name in container:
-                mock_func = TestAsyncMock()
-                mock_func._mcp_tool = MagicMock()
-                mock_func._mcp_tool.name = name
-                yield name, mock_func
-    
-    entry._iter_tools = mock_iter_tools
-    
-    # Mock get_artifact_tools
-    def mock_get_artifact_tools():
-        return {
-            "upload_file": TestAsyncMock(return_value="uploaded"),
-            "write_file": TestAsyncMock(return_value="written"),
-            "read_file": TestAsyncMock(return_value="content"),
-            "list_session_files": TestAsyncMock(return_value=[])
-        }
-    
-    entry.get_artifact_tools = mock_get_artifact_tools
+    """Apply comprehensive session management patches for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Core classes
+        mp.setattr(entry, "MCPSessionManager", EnhancedMockMCPSessionManager)
+        mp.setattr(entry, "SessionContext", MockSessionContext, raising=False)
+        mp.setattr(entry, "create_mcp_session_manager", lambda config: EnhancedMockMCPSessionManager(
+            sandbox_id=config.get("sessions", {}).get("sandbox_id") if config else None,
+            default_ttl_hours=config.get("sessions", {}).get("default_ttl_hours", 24) if config else 24
+        ))
+        
+        # Replace proxy manager with universal version
+        mp.setattr(entry, "ProxyServerManager", UniversalMockProxyServerManager)
+        
+        # Helper functions
+        mp.setattr(entry, "with_session_auto_inject", mock_with_session_auto_inject, raising=False)
+        mp.setattr(entry, "require_session", mock_require_session, raising=False)
+        mp.setattr(entry, "get_session_or_none", mock_get_session_or_none, raising=False)
+        
+        # Tool registration and discovery
+        mp.setattr(entry, "register_artifacts_tools", mock_register_artifacts_tools)
+        mp.setattr(entry, "register_session_tools", mock_register_session_tools)
+        mp.setattr(entry, "_iter_tools", mock_iter_tools)
+        mp.setattr(entry, "get_artifact_tools", mock_get_artifact_tools)
+        yield
 
 # Tests
 def test_need_proxy_function():
     """Test that the _need_proxy function correctly identifies proxy config."""
-    patch_session_management()
-    
     # Test with HAS_PROXY_SUPPORT = True (default)
     assert entry._need_proxy({"proxy": {"enabled": True}}) is True
     assert entry._need_proxy({"proxy": {"enabled": False}}) is False
@@ -209,8 +223,6 @@ def test_need_proxy_function():
 
 def test_proxy_server_manager_mock():
     """Test that ProxyServerManager is mocked correctly."""
-    patch_session_management()
-    
     # Get the ProxyServerManager from entry
     assert entry.ProxyServerManager is UniversalMockProxyServerManager
     
@@ -226,8 +238,6 @@ def test_proxy_server_manager_mock():
 
 def test_session_manager_creation():
     """Test that session manager is properly created."""
-    patch_session_management()
-    
     config = {
         "sessions": {
             "sandbox_id": "test-sandbox",
@@ -240,59 +250,49 @@ def test_session_manager_creation():
     assert session_manager.sandbox_id == "test-sandbox"
     assert session_manager.default_ttl_hours == 48
 
-def test_comprehensive_session_workflow():
+async def test_comprehensive_session_workflow():
     """Test a comprehensive session workflow."""
-    patch_session_management()
+    # Create session manager
+    session_manager = EnhancedMockMCPSessionManager()
     
-    async def test_workflow():
-        # Create session manager
-        session_manager = EnhancedMockMCPSessionManager()
-        
-        # Create session
-        session_id = await session_manager.create_session(
-            user_id="workflow_user",
-            metadata={"test": "data"}
-        )
-        
-        # Set context
-        session_manager.set_current_session(session_id, "workflow_user")
-        
-        # Verify context
-        assert mock_require_session() == session_id
-        assert mock_get_session_or_none() == session_id
-        
-        # Test session auto-injection
-        args = {"filename": "test.txt", "content": "data"}
-        injected = await entry.with_session_auto_inject(
-            session_manager, "upload_file", args
-        )
-        assert injected["session_id"] == session_id
-        
-        # Update session
-        success = await session_manager.update_session_metadata(
-            session_id, {"updated": True}
-        )
-        assert success is True
-        
-        # Get session info - should have both metadata structures
-        info = await session_manager.get_session_info(session_id)
-        assert info["user_id"] == "workflow_user"
-        assert info["custom_metadata"]["test"] == "data"
-        assert info["custom_metadata"]["updated"] is True
-        
-        # Clean up
-        session_manager.clear_context()
-        assert mock_get_session_or_none() is None
-        
-        return True
+    # Create session
+    session_id = await session_manager.create_session(
+        user_id="workflow_user",
+        metadata={"test": "data"}
+    )
     
-    result = run_async(test_workflow())
-    assert result is True
+    # Set context
+    session_manager.set_current_session(session_id, "workflow_user")
+    
+    # Verify context
+    assert mock_require_session() == session_id
+    assert mock_get_session_or_none() == session_id
+    
+    # Test session auto-injection
+    args = {"filename": "test.txt", "content": "data"}
+    injected = await entry.with_session_auto_inject(
+        session_manager, "upload_file", args
+    )
+    assert injected["session_id"] == session_id
+    
+    # Update session
+    success = await session_manager.update_session_metadata(
+        session_id, {"updated": True}
+    )
+    assert success is True
+    
+    # Get session info - should have both metadata structures
+    info = await session_manager.get_session_info(session_id)
+    assert info["user_id"] == "workflow_user"
+    assert info["custom_metadata"]["test"] == "data"
+    assert info["custom_metadata"]["updated"] is True
+    
+    # Clean up
+    session_manager.clear_context()
+    assert mock_get_session_or_none() is None
 
-def test_tool_naming_compatibility():
+async def test_tool_naming_compatibility():
     """Test that the proxy manager supports tool naming compatibility."""
-    patch_session_management()
-    
     # Create a proxy manager with tools in different formats
     proxy_mgr = UniversalMockProxyServerManager({
         "proxy": {
@@ -308,104 +308,86 @@ def test_tool_naming_compatibility():
     }
     
     # Test get_all_tools (async function)
-    tools = run_async(proxy_mgr.get_all_tools())
+    tools = await proxy_mgr.get_all_tools()
     assert "proxy.test.tool" in tools
     
     # Test process_text functionality (async function)
-    result = run_async(proxy_mgr.process_text("Test text"))
+    result = await proxy_mgr.process_text("Test text")
     assert result[0]["processed"] is True
     assert result[0]["text"] == "Test text"
     
     # Test call_tool with different naming formats (async function)
     # With dot notation
-    result1 = run_async(proxy_mgr.call_tool("proxy.test.tool", query="test"))
+    result1 = await proxy_mgr.call_tool("proxy.test.tool", query="test")
     assert "result" in result1.lower() or "response" in result1.lower()
     
     # With underscore notation
-    result2 = run_async(proxy_mgr.call_tool("test_tool", query="test"))
+    result2 = await proxy_mgr.call_tool("test_tool", query="test")
     assert "result" in result2.lower() or "response" in result2.lower()
 
-def test_session_context_integration():
+async def test_session_context_integration():
     """Test session context integration."""
-    patch_session_management()
+    session_manager = EnhancedMockMCPSessionManager()
     
-    async def test_session_flow():
-        session_manager = EnhancedMockMCPSessionManager()
-        
-        async with MockSessionContext(session_manager, auto_create=True) as session_id:
-            assert session_id is not None
-            assert session_id.startswith("session-")
-            
-        return True
-    
-    result = run_async(test_session_flow())
-    assert result is True
+    async with MockSessionContext(session_manager, auto_create=True) as session_id:
+        assert session_id is not None
+        assert session_id.startswith("session-")
 
-def test_session_auto_injection():
+async def test_session_auto_injection():
     """Test automatic session injection for artifact tools."""
-    patch_session_management()
+    session_manager = EnhancedMockMCPSessionManager()
     
-    async def test_injection():
-        session_manager = EnhancedMockMCPSessionManager()
-        
-        # Test with artifact tool
-        args = {"content": "test content", "filename": "test.txt"}
-        injected_args = await entry.with_session_auto_inject(
-            session_manager, "upload_file", args
-        )
-        
-        assert "session_id" in injected_args
-        assert injected_args["session_id"].startswith("session-")
-        
-        # Test with non-artifact tool
-        args2 = {"query": "test"}
-        injected_args2 = await entry.with_session_auto_inject(
-            session_manager, "search_web", args2
-        )
-        
-        assert injected_args2 == args2  # No injection for non-artifact tools
-        
-        return True
+    # Test with artifact tool
+    args = {"content": "test content", "filename": "test.txt"}
+    injected_args = await entry.with_session_auto_inject(
+        session_manager, "upload_file", args
+    )
+    
+    assert "session_id" in injected_args
+    assert injected_args["session_id"].startswith("session-")
+    
+    # Test with non-artifact tool
+    args2 = {"query": "test"}
+    injected_args2 = await entry.with_session_auto_inject(
+        session_manager, "search_web", args2
+    )
     
-    result = run_async(test_injection())
-    assert result is True
+    assert injected_args2 == args2  # No injection for non-artifact tools
 
-def test_initialize_tool_registry_called():
+def test_initialize_tool_registry_called(monkeypatch):
     """Test that initialize_tool_registry is called during runtime startup."""
-    patch_session_management()
-    
     # Ensure the artifacts_tools module is properly mocked
     assert "chuk_mcp_runtime.tools.artifacts_tools" in sys.modules
     
-    # Using context managers is cleaner and safer
-    with patch('chuk_mcp_runtime.entry.ServerRegistry', DummyServerRegistry), \
-         patch('chuk_mcp_runtime.entry.initialize_tool_registry') as mock_init, \
-         patch('chuk_mcp_runtime.entry.load_config', return_value={
-             "proxy": {"enabled": False},
-             "sessions": {"sandbox_id": "test"}
-         }), \
-         patch('chuk_mcp_runtime.entry.configure_logging'), \
-         patch('chuk_mcp_runtime.entry.find_project_root', return_value="/tmp"), \
-         patch('asyncio.run', side_effect=run_async):
-        
-        # Create a custom server that won't try to use stdio
-        server = DummyMCPServer({
-            "server": {"type": "stdio"},
-            "sessions": {"sandbox_id": "test"}
-        })
-        
-        # Patch MCPServer separately to use our custom instance
-        with patch('chuk_mcp_runtime.entry.MCPServer', return_value=server):
-            # Make initialize_tool_registry an async mock
-            async def mock_init_async(*args, **kwargs):
-                return None
-            mock_init.side_effect = mock_init_async
-            
-            # Run the runtime
-            entry.run_runtime()
-            
-            # Check that initialize_tool_registry was called
-            assert mock_init.called
+    # Create a custom server that won't try to use stdio
+    server = DummyMCPServer({
+        "server": {"type": "stdio"},
+        "sessions": {"sandbox_id": "test"}
+    })
+    
+    # Make initialize_tool_registry an async mock
+    async def mock_init_async(*args, **kwargs):
+        return None
+    mock_init = MagicMock(side_effect=mock_init_async)
+    
+    monkeypatch.setattr(entry, "ServerRegistry", DummyServerRegistry)
+    monkeypatch.setattr(entry, "initialize_tool_registry", mock_init)
+    monkeypatch.setattr(entry, "load_config", lambda paths, default: {
+        "proxy": {"enabled": False},
+        "sessions": {"sandbox_id": "test"}
+    })
+    monkeypatch.setattr(entry, "configure_logging", lambda cfg: None)
+    monkeypatch.setattr(entry, "find_project_root", lambda *a, **kw: "/tmp")
+    monkeypatch.setattr(entry, "MCPServer", lambda cfg, tools_registry=None: server)
+    monkeypatch.setattr("asyncio.run", run_async)
+    
+    # Run the runtime
+    entry.run_runtime()
+    
+    # Check that initialize_tool_registry was called
+    assert mock_init.called
+    assert server.serve_called
+    assert set(server.registered_tools) == set(_ARTIFACT_TOOLS)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
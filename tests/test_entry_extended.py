@@ -1,9 +1,9 @@
 # tests/test_entry_extended.py
-import os
 import sys
+import itertools
 import asyncio
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock
 
 import chuk_mcp_runtime.entry as entry
 from chuk_mcp_runtime.common.mcp_tool_decorator import TOOLS_REGISTRY
@@ -17,10 +17,11 @@ class MockMCPSessionManager:
         self.default_ttl_hours = default_ttl_hours
         self.auto_extend_threshold = auto_extend_threshold
         self._sessions = {}
+        self._session_ids = itertools.count()
         self._current_session = None
         
     async def create_session(self, user_id=None, ttl_hours=None, metadata=None):
-        session_id = f"session-{len(self._sessions)}"
+        session_id = f"session-{next(self._session_ids)}"
         self._sessions[session_id] = {
             "user_id": user_id,
             "metadata": metadata or {},
@@ -122,132 +123,128 @@ class MockArtifactTools:
         return "Mock write result"
 
 @pytest.fixture(autouse=True)
-def patch_entry(monkeypatch):
-    """Set up common patches for entry module tests."""
-    # Clear TOOLS_REGISTRY before each test
+def clear_tools_registry():
+    """Start and finish every test with an empty TOOLS_REGISTRY."""
     TOOLS_REGISTRY.clear()
-    
-    # Mock configuration and logging
-    monkeypatch.setattr(entry, "load_config", lambda paths, default: {
-        "proxy": {"enabled": True},
-        "artifacts": {"enabled": True, "tools": {"enabled": True}},
-        "sessions": {"sandbox_id": "test-sandbox"}
-    })
-    monkeypatch.setattr(entry, "configure_logging", lambda cfg: None)
-    monkeypatch.setattr(entry, "find_project_root", lambda *a, **kw: "/tmp")
-    
-    # Mock native session management
-    monkeypatch.setattr(entry, "MCPSessionManager", MockMCPSessionManager)
-    monkeypatch.setattr(entry, "SessionContext", MockSessionContext)
-    monkeypatch.setattr(entry, "create_mcp_session_manager", 
-                       lambda config: MockMCPSessionManager())
-    
-    # Mock session integration helper
-    async def mock_with_session_auto_inject(session_manager, tool_name, args):
-        # Simulate session injection for artifact tools
-        artifact_tools = {
-            "upload_file", "write_file", "read_file", "delete_file",
-            "list_session_files", "list_directory", "copy_file", "move_file",
-            "get_file_metadata", "get_presigned_url", "get_storage_stats"
-        }
+    yield
+    TOOLS_REGISTRY.clear()
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_entry():
+    """Set up common patches for entry module tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Mock configuration and logging
+        mp.setattr(entry, "load_config", lambda paths, default: {
+            "proxy": {"enabled": True},
+            "artifacts": {"enabled": True, "tools": {"enabled": True}},
+            "sessions": {"sandbox_id": "test-sandbox"}
+        })
+        mp.setattr(entry, "configure_logging", lambda cfg: None)
+        mp.setattr(entry, "find_project_root", lambda *a, **kw: "/tmp")
         
-        if tool_name in artifact_tools and "session_id" not in args:
-            session_id = await session_manager.auto_create_session_if_needed()
-            return {**args, "session_id": session_id}
-        return args
-    
-    monkeypatch.setattr(entry, "with_session_auto_inject", mock_with_session_auto_inject)
-    
-    # Mock the server classes
-    monkeypatch.setattr(entry, "ServerRegistry", DummyServerRegistry)
-    monkeypatch.setattr(entry, "MCPServer", DummyMCPServer)
-    
-    # Mock the proxy manager
-    monkeypatch.setattr(entry, "ProxyServerManager", MockProxyServerManager)
-    
-    # Mock initialize_tool_registry and other tool functions
-    mock_init_registry = AsyncMock()
-    monkeypatch.setattr(entry, "initialize_tool_registry", mock_init_registry)
-    
-    # Mock the artifact tools registration
-    mock_register_artifacts = AsyncMock(return_value=True)
-    monkeypatch.setattr(entry, "register_artifacts_tools", mock_register_artifacts)
-    
-    # Mock the session tools registration
-    mock_register_session = AsyncMock(return_value=True)
-    monkeypatch.setattr(entry, "register_session_tools", mock_register_session)
-    
-    # Mock get_artifact_tools function
-    def mock_get_artifact_tools():
-        return {
-            "upload_file": MockArtifactTools.upload_file,
-            "write_file": MockArtifactTools.write_file,
-            "read_file": AsyncMock(return_value="mock file content"),
-            "list_session_files": AsyncMock(return_value=[])
-        }
-    
-    monkeypatch.setattr(entry, "get_artifact_tools", mock_get_artifact_tools)
-    
-    # Mock the _iter_tools function
-    def mock_iter_tools(container):
-        if isinstance(container, dict):
-            for name, func in container.items():
-                # Create a mock function with _mcp_tool attribute
-                mock_func = AsyncMock()
-                mock_func._mcp_tool = MagicMock()
-                mock_func._mcp_tool.name = name
-                yield name, mock_func
-        elif isinstance(container, (list, tuple, set)):
-            for name in container:
-                mock_func = AsyncMock()
-                mock_func._mcp_tool = MagicMock()
-                mock_func._mcp_tool.name = name
-                yield name, mock_func
-    
-    monkeypatch.setattr(entry, "_iter_tools", mock_iter_tools)
-    
-    # Mock openai compatibility
-    mock_init_openai = AsyncMock()
-    monkeypatch.setattr(entry, "initialize_openai_compatibility", mock_init_openai)
-    
-    # Mock asyncio.run to use our run_async helper
-    monkeypatch.setattr(asyncio, "run", run_async)
-    
-    # Mock stdio_server
-    async def dummy_stdio_server():
-        class DummyStream:
-            async def read(self, n=-1):
-                return b""
-                
-            async def write(self, data):
-                return len(data)
-                
-            async def close(self):
+        # Mock native session management
+        mp.setattr(entry, "MCPSessionManager", MockMCPSessionManager)
+        mp.setattr(entry, "SessionContext", MockSessionContext, raising=False)
+        mp.setattr(entry, "create_mcp_session_manager", 
+                           lambda config: MockMCPSessionManager())
+        
+        # Mock session integration helper
+        async def mock_with_session_auto_inject(session_manager, tool_name, args):
+            # Simulate session injection for artifact tools
+            artifact_tools = {
+                "upload_file", "write_file", "read_file", "delete_file",
+                "list_session_files", "list_directory", "copy_file", "move_file",
+                "get_file_metadata", "get_presigned_url", "get_storage_stats"
+            }
+            
+            if tool_name in artifact_tools and "session_id" not in args:
+                session_id = await session_manager.auto_create_session_if_needed()
+                return {**args, "session_id": session_id}
+            return args
+        
+        mp.setattr(entry, "with_session_auto_inject", mock_with_session_auto_inject, raising=False)
+        
+        # Mock the server classes
+        mp.setattr(entry, "ServerRegistry", DummyServerRegistry)
+        mp.setattr(entry, "MCPServer", DummyMCPServer)
+        
+        # Mock the proxy manager
+        mp.setattr(entry, "ProxyServerManager", MockProxyServerManager)
+        
+        # Mock initialize_tool_registry and other tool functions
+        mock_init_registry = AsyncMock()
+        mp.setattr(entry, "initialize_tool_registry", mock_init_registry)
+        
+        # Mock the artifact tools registration
+        mock_register_artifacts = AsyncMock(return_value=True)
+        mp.setattr(entry, "register_artifacts_tools", mock_register_artifacts)
+        
+        # Mock the session tools registration
+        mock_register_session = AsyncMock(return_value=True)
+        mp.setattr(entry, "register_session_tools", mock_register_session)
+        
+        # Mock get_artifact_tools function
+        def mock_get_artifact_tools():
+            return {
+                "upload_file": MockArtifactTools.upload_file,
+                "write_file": MockArtifactTools.write_file,
+                "read_file": AsyncMock(return_value="mock file content"),
+                "list_session_files": AsyncMock(return_value=[])
+            }
+        
+        mp.setattr(entry, "get_artifact_tools", mock_get_artifact_tools)
+        
+        # Mock the _iter_tools function
+        def mock_iter_tools(container):
+            if isinstance(container, dict):
+                for name, func in container.items():
+                    # Create a mock function with _mcp_tool attribute
+                    mock_func = AsyncMock()
+                    mock_func._mcp_tool = MagicMock()
+                    mock_func._mcp_tool.name = name
+                    yield name, mock_func
+            elif isinstance(container, (list, tuple, set)):
+                for name in container:
+                    mock_func = AsyncMock()
+                    mock_func._mcp_tool = MagicMock()
+                    mock_func._mcp_tool.name = name
+                    yield name, mock_func
+        
+        mp.setattr(entry, "_iter_tools", mock_iter_tools)
+        
+        # Mock openai compatibility
+        mock_init_openai = AsyncMock()
+        mp.setattr(entry, "initialize_openai_compatibility", mock_init_openai)
+        
+        # Mock asyncio.run to use our run_async helper
+        mp.setattr(asyncio, "run", run_async)
+        
+        # Mock stdio_server
+        async def dummy_stdio_server():
+            class DummyStream:
+                async def read(self, n=-1):
+                    return b""
+                    
+                async def write(self, data):
+                    return len(data)
+                    
+                async def close(self):
+                    pass
+            
+            read_stream = DummyStream()
+            write_stream = DummyStream()
+            
+            try:
+                yield (read_stream, write_stream)
+            finally:
                 pass
         
-        read_stream = DummyStream()
-        write_stream = DummyStream()
+        # Create a mock mcp.server.stdio module
+        mock_stdio = MagicMock()
+        mock_stdio.stdio_server = dummy_stdio_server
+        mp.setitem(sys.modules, "mcp.server.stdio", mock_stdio)
         
-        try:
-            yield (read_stream, write_stream)
-        finally:
-            pass
-    
-    # Create a mock mcp.server.stdio module
-    mock_stdio = MagicMock()
-    mock_stdio.stdio_server = dummy_stdio_server
-    sys.modules["mcp.server.stdio"] = mock_stdio
-    
-    # Reset environment variables
-    yield
-    
-    # Clean up
-    os.environ.pop("NO_BOOTSTRAP", None)
-    if "mcp.server.stdio" in sys.modules:
-        del sys.modules["mcp.server.stdio"]
-    
-    # Clear registry after test
-    TOOLS_REGISTRY.clear()
+        yield
 
 def test_run_runtime_default_bootstrap(monkeypatch):
     """Test runtime with default bootstrap enabled."""
@@ -270,7 +267,7 @@ def test_run_runtime_default_bootstrap(monkeypatch):
 def test_run_runtime_skip_bootstrap_flag(monkeypatch):
     """Test that NO_BOOTSTRAP env var prevents bootstrap."""
     # Set the environment variable
-    os.environ["NO_BOOTSTRAP"] = "1"
+    monkeypatch.setenv("NO_BOOTSTRAP", "1")
     
     # Create a registry spy
     registry_called = {}
@@ -533,7 +530,13 @@ def test_main_failure(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "Error starting CHUK MCP server: bang" in captured.err
 
-def test_config_path_handling(monkeypatch):
+@pytest.mark.parametrize("argv, expected_paths", [
+    (["prog"], None),
+    (["prog", "-c", "test.yaml"], ["test.yaml"]),
+    (["prog", "--config", "test.yaml"], ["test.yaml"]),
+    (["prog", "test.yaml"], ["test.yaml"]),
+])
+def test_config_path_handling(monkeypatch, argv, expected_paths):
     """Test various config path handling scenarios."""
     config_calls = []
     
@@ -542,22 +545,13 @@ def test_config_path_handling(monkeypatch):
         return {"proxy": {"enabled": False}}
         
     monkeypatch.setattr(entry, "load_config", mock_load_config)
+    monkeypatch.delenv("CHUK_MCP_CONFIG_PATH", raising=False)
+    monkeypatch.setattr(sys, "argv", argv)
     
-    # Test with no config path
-    monkeypatch.setattr(sys, "argv", ["prog"])
-    entry.main()
-    
-    # Should have called with None for paths
-    assert len(config_calls) == 1
-    assert config_calls[0] is None
-    
-    # Test with -c flag
-    config_calls.clear()
-    monkeypatch.setattr(sys, "argv", ["prog", "-c", "test.yaml"])
     entry.main()
     
-    assert len(config_calls) == 1
-    assert config_calls[0] == ["test.yaml"]
+    # Should have called load_config exactly once with the resolved paths
+    assert config_calls == [expected_paths]
 
 def test_keyboard_interrupt_handling(monkeypatch):
     """Test that KeyboardInterrupt is handled gracefully."""